@@ -6,10 +6,10 @@ import aisuite as ai
 
 from copy import deepcopy
 from .actions.Action import Action
-from typing import List, Dict, Any
+from typing import Sequence, Dict, Any
 from faker import Faker
 from .Interaction import Interaction
-from .AgentInteractionManager import AgentInteractionManager
+from .AgentInteractionManager import AgentInteractionManager, get_instance
 from .Config import Config
 from .utils import cache_w_checkpoint_manager
 from .actions.default_actions import default_actions
@@ -44,7 +44,7 @@ class Agent:
             all agent interactions
     """
 
-    _interaction_manager = AgentInteractionManager()
+    _interaction_manager: AgentInteractionManager = get_instance()
     _allow_init = False
 
     _default_generate_agent_prompt = """You're goal is to generate the bio of a fictional person.
@@ -298,6 +298,19 @@ Don't forget to close each tag that you open.
 
         return response.choices[0].message.content
 
+    @staticmethod
+    def _format_interactions(interactions: Sequence[Interaction]) -> str:
+        """
+        Format an agent's interactions to be included in a prompt.
+
+        Args:
+            interactions (Sequence[Interaction]): The interactions to format.
+
+        Returns:
+            str: The formatted interactions.
+        """
+        return str(list(interactions))
+
     @cache_w_checkpoint_manager
     def act(self) -> str:
         """
@@ -328,7 +341,7 @@ Don't forget to close each tag that you open.
 
         self_introduction = self._self_introduction_prompt.format(
             agent_informations=self.agent_informations,
-            interactions=self.get_interactions(),
+            interactions=self._interaction_manager.get_cached_context(self, Agent._format_interactions),
         )
 
         prompt = self._act_prompt.format(
@@ -388,13 +401,13 @@ Don't forget to close each tag that you open.
         """
         return Agent.__str__(self)
 
-    def get_interactions(self) -> List[Interaction]:
+    def get_interactions(self) -> Sequence[Interaction]:
         """
-        Retrieve all interactions involving this agent.
+        Retrieve the interactions involving this agent.
 
         Returns:
-            List[Interaction]: A list of all interactions where this agent
-                was either the sender or receiver.
+            Sequence[Interaction]: A read-only view of the most recent interactions
+                where this agent was either the sender or receiver.
         """
         return self._interaction_manager.get_agent_interactions(self)
 
@@ -416,7 +429,7 @@ Don't forget to close each tag that you open.
 
         prompt = self._self_introduction_prompt.format(
             agent_informations=self.agent_informations,
-            interactions=self.get_interactions(),
+            interactions=self._interaction_manager.get_cached_context(self, Agent._format_interactions),
         )
 
         prompt += f"\nYou are asked the following question: {message}. Answer the question as best as you can."
@@ -550,7 +563,7 @@ if __name__ == "__main__":
 
     interaction = Interaction(
         sender=Agent.create_agent(name="Alice", bio="Alice is a software engineer."),
-        receiver=Agent.create_agent(name="Bob", bio="Bob is a data scientist."),
+        receiver=[Agent.create_agent(name="Bob", bio="Bob is a data scientist.")],
         message="Hello Bob! I heard you're working on some interesting data science projects."
     )
 
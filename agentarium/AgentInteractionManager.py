@@ -1,12 +1,57 @@
 from __future__ import annotations
 
-from typing import Dict, List, TYPE_CHECKING
+import sys
+import threading
+
+from collections import abc, deque
+from typing import Callable, Deque, Dict, List, Sequence, Tuple, TYPE_CHECKING
+from .Config import Config
 from .Interaction import Interaction
+from .InteractionLog import InteractionLog
 
 if TYPE_CHECKING:
     from .Agent import Agent
 
 
+class InteractionHistoryView(abc.Sequence):
+    """
+    A read-only, live view over an interaction history kept by the AgentInteractionManager.
+
+    The view supports indexing, slicing (which returns a list), iteration and len(),
+    without copying the underlying history, and reflects interactions recorded after
+    it was retrieved (until the agent is reset). It cannot be used to modify the history.
+    """
+
+    __slots__ = ("_interactions",)
+
+    def __init__(self, interactions: Deque[Interaction]):
+        """
+        Create a view over the given interactions.
+
+        Args:
+            interactions (Deque[Interaction]): The interaction history to expose.
+        """
+        self._interactions = interactions
+
+    def __getitem__(self, index: int | slice) -> Interaction | List[Interaction]:
+        if isinstance(index, slice):
+            return list(self._interactions)[index]
+
+        return self._interactions[index]
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def __iter__(self):
+        return iter(self._interactions)
+
+    def __reversed__(self):
+        return reversed(self._interactions)
+
+    def __repr__(self) -> str:
+        return repr(list(self._interactions))
+
+
 class AgentInteractionManager:
     """
     A singleton class that manages all interactions between agents in the environment.
@@ -17,10 +62,12 @@ class AgentInteractionManager:
     - Providing access to interaction history for both individual agents and the entire system
 
     The manager implements the Singleton pattern to ensure a single source of truth
-    for all agent interactions across the environment.
+    for all agent interactions across the environment. Creating the instance is
+    thread-safe.
     """
 
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         """
@@ -29,9 +76,13 @@ class AgentInteractionManager:
         Returns:
             AgentInteractionManager: The single instance of the manager.
         """
+        # Double-checked locking: the lock is only taken while the instance doesn't exist yet
         if cls._instance is None:
-            cls._instance = super(AgentInteractionManager, cls).__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(AgentInteractionManager, cls).__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self):
@@ -39,32 +90,98 @@ class AgentInteractionManager:
         Initializes the interaction manager if not already initialized.
 
         Due to the singleton pattern, this will only execute once, even if
-        multiple instances are created.
+        multiple instances are created concurrently.
         """
         if not self._initialized:
-            self._agents: Dict[str, Agent] = {}
-            self._interactions: List[Interaction] = []
-            self._agent_private_interactions: Dict[str, List[Interaction]] = {}
-            self._initialized = True
+            with self._lock:
+                if not self._initialized:
+                    self._agents: Dict[str, Agent] = {}
+
+                    # Bumped whenever a registered agent ID is bound to another agent instance,
+                    # which invalidates the string representations cached by the interactions
+                    self._registry_version: int = 0
+
+                    # Global history: keeps every interaction, it is not bounded by `history_limit`
+                    self._interactions: List[Interaction] = []
+
+                    # Per-agent state, indexed by the handle assigned to each agent at registration.
+                    # Private histories only keep the most recent `history_limit` interactions (all if None).
+                    self._history_limit: int | None = Config().history_limit
+                    self._agents_by_handle: List[Agent] = []
+                    self._private_by_handle: List[Deque[Interaction]] = []
+
+                    # Interactions between each pair of agents, as seen by the first agent of the pair
+                    self._pairwise_by_handle: List[Dict[int, Deque[Interaction]]] = []
+
+                    # Version of each agent's private history, bumped whenever it changes,
+                    # and the last context built from it: handle -> (version, builder, context)
+                    self._versions_by_handle: List[int] = []
+                    self._context_cache: Dict[int, Tuple[int, Callable, str]] = {}
+
+                    # Optional on-disk copy of the global interaction history
+                    self._interaction_log: InteractionLog | None = None
+
+                    self._initialized = True
 
     def register_agent(self, agent: Agent) -> None:
         """
         Register a new agent with the interaction manager.
 
-        This method adds the agent to the manager's registry and initializes
-        their private interaction history.
+        This method adds the agent to the manager's registry, assigns it a handle
+        (its index in the manager's per-agent lists) and initializes their private
+        interaction history. Registering an agent ID twice reuses its handle.
 
         Args:
             agent (Agent): The agent to register with the manager.
         """
+        if type(agent.agent_id) is str:
+            agent.agent_id = sys.intern(agent.agent_id)
+
+        if agent.agent_id in self._agents:
+            agent._handle = self._agents[agent.agent_id]._handle
+            self._agents_by_handle[agent._handle] = agent
+            self._private_by_handle[agent._handle] = deque(maxlen=self._history_limit)
+            self._pairwise_by_handle[agent._handle] = {}
+            self._versions_by_handle[agent._handle] += 1
+            self._registry_version += 1
+        else:
+            agent._handle = len(self._agents_by_handle)
+            self._agents_by_handle.append(agent)
+            self._private_by_handle.append(deque(maxlen=self._history_limit))
+            self._pairwise_by_handle.append({})
+            self._versions_by_handle.append(0)
+
         self._agents[agent.agent_id] = agent
-        self._agent_private_interactions[agent.agent_id] = []
 
     def reset_agent(self, agent: Agent) -> None:
         """
         Reset the agent's state.
         """
-        self._agent_private_interactions[agent.agent_id] = []
+        handle = self._get_handle(agent)
+
+        if handle is None:
+            return
+
+        self._private_by_handle[handle] = deque(maxlen=self._history_limit)
+        self._pairwise_by_handle[handle] = {}
+        self._versions_by_handle[handle] += 1
+
+    def _get_handle(self, agent: Agent) -> int | None:
+        """
+        Retrieve the handle of the agent registered under the given agent's ID.
+
+        The handle is looked up through the registry rather than read from the agent,
+        so that objects sharing a registered agent's ID resolve to the same handle.
+
+        Args:
+            agent (Agent): The agent whose handle to retrieve.
+
+        Returns:
+            int | None: The agent's handle if their ID is registered, None otherwise.
+        """
+        registered_agent = self._agents.get(agent.agent_id)
+
+        return None if registered_agent is None else registered_agent._handle
 
     def get_agent(self, agent_id: str) -> Agent | None:
         """
@@ -99,44 +216,237 @@ class AgentInteractionManager:
         if isinstance(receiver, Agent):
             receiver = [receiver]
 
-        if any(_receiver.agent_id not in self._agents for _receiver in receiver):
-            invalid_receivers = [_receiver for _receiver in receiver if _receiver.agent_id not in self._agents]
-            raise ValueError(f"Receiver agent(s) {invalid_receivers} not registered in the interaction manager.")
+        receiver_ids = tuple(_receiver.agent_id for _receiver in receiver)
+        invalid_receiver_ids = set(receiver_ids).difference(self._agents.keys())
+
+        if invalid_receiver_ids:
+            raise ValueError(f"Receiver agent(s) {invalid_receiver_ids} not registered in the interaction manager.")
+
+        self._store_interaction(sender.agent_id, receiver_ids, message)
+
+    def record_interactions_batch(self, entries: Sequence[Tuple[Agent, Agent | list[Agent], str]]) -> None:
+        """
+        Record several interactions at once.
+
+        All the agents involved are validated in a single pass before any interaction
+        is recorded, so either every interaction is recorded or none of them is.
+
+        Args:
+            entries (Sequence[Tuple[Agent, Agent | list[Agent], str]]): The interactions to record,
+                as (sender, receiver(s), message) tuples, in order.
+
+        Raises:
+            ValueError: If any of the agents involved is not registered in the interaction manager.
+        """
+
+        from .Agent import Agent
+
+        entries = [
+            (sender, [receiver] if isinstance(receiver, Agent) else receiver, message)
+            for sender, receiver, message in entries
+        ]
+        receiver_ids = [tuple(_receiver.agent_id for _receiver in receiver) for _, receiver, _ in entries]
+
+        invalid_agent_ids = {sender.agent_id for sender, _, _ in entries}.union(*receiver_ids).difference(self._agents.keys())
+
+        if invalid_agent_ids:
+            raise ValueError(f"Agent(s) {invalid_agent_ids} not registered in the interaction manager.")
+
+        store_interaction = self._store_interaction
+
+        for (sender, _, message), _receiver_ids in zip(entries, receiver_ids):
+            store_interaction(sender.agent_id, _receiver_ids, message)
+
+    def _store_interaction(self, sender_id: str, receiver_ids: Tuple[str, ...], message: str) -> None:
+        """
+        Store an already validated interaction in all the interaction histories.
+
+        The agents are resolved to their registered instances (the ones holding a handle)
+        before anything is stored, so the interaction is either fully stored or not at all.
+
+        Args:
+            sender_id (str): The ID of the agent initiating the interaction.
+            receiver_ids (Tuple[str, ...]): The IDs of the agent(s) receiving the interaction.
+            message (str): The content of the interaction.
+        """
+
+        agents = self._agents
+        sender_handle = agents[sender_id]._handle
+        receiver_handles = [agents[_receiver_id]._handle for _receiver_id in receiver_ids]
 
-        interaction = Interaction(sender=sender, receiver=receiver, message=message)
+        interaction = Interaction.from_ids(sender_id, receiver_ids, message)
 
         # Record in global interactions
         self._interactions.append(interaction)
 
+        if self._interaction_log is not None:
+            self._interaction_log.append(sender_handle, receiver_handles, message)
+
         # Record in private interactions for both sender and receiver
-        self._agent_private_interactions[sender.agent_id].append(interaction)
+        # along with the pairwise conversations between the sender and each receiver
+        private_by_handle = self._private_by_handle
+        versions_by_handle = self._versions_by_handle
+
+        private_by_handle[sender_handle].append(interaction)
+        versions_by_handle[sender_handle] += 1
+
+        for receiver_handle in receiver_handles:
+            self._get_conversation(sender_handle, receiver_handle).append(interaction)
+
+            if receiver_handle != sender_handle:
+                private_by_handle[receiver_handle].append(interaction)
+                versions_by_handle[receiver_handle] += 1
+                self._get_conversation(receiver_handle, sender_handle).append(interaction)
+
+    def _get_conversation(self, handle: int, other_handle: int) -> Deque[Interaction]:
+        """
+        Retrieve (and create if needed) the conversation of an agent with another agent.
+
+        Args:
+            handle (int): The handle of the agent whose view of the conversation to retrieve.
+            other_handle (int): The handle of the other agent of the conversation.
+
+        Returns:
+            Deque[Interaction]: The interactions between both agents, oldest first.
+        """
+        conversations = self._pairwise_by_handle[handle]
+        conversation = conversations.get(other_handle)
+
+        if conversation is None:
+            conversation = conversations[other_handle] = deque(maxlen=self._history_limit)
+
+        return conversation
+
+    def enable_interaction_log(self, path: str) -> InteractionLog:
+        """
+        Start recording every new interaction in a memory-mapped log on disk.
+
+        Args:
+            path (str): Path prefix of the log files.
+
+        Returns:
+            InteractionLog: The log the interactions are recorded in.
+        """
+        if self._interaction_log is not None:
+            self._interaction_log.close()
 
-        for _receiver in receiver:
-            if _receiver.agent_id != sender.agent_id:
-                self._agent_private_interactions[_receiver.agent_id].append(interaction)
+        self._interaction_log = InteractionLog(path)
+        return self._interaction_log
+
+    def get_interaction_log(self) -> InteractionLog | None:
+        """
+        Retrieve the log the interactions are recorded in, if any.
+
+        Returns:
+            InteractionLog | None: The interaction log if enabled, None otherwise.
+        """
+        return self._interaction_log
 
     def get_all_interactions(self) -> List[Interaction]:
         """
         Retrieve the complete history of all interactions in the environment.
 
         This method is primarily used for administrative and debugging purposes.
+        Unlike the agents' histories, the global history is not bounded by the
+        history limit: it keeps (and holds in memory) every recorded interaction.
 
         Returns:
             List[Interaction]: A list of all interactions that have occurred.
         """
         return self._interactions
 
-    def get_agent_interactions(self, agent: Agent) -> List[Interaction]:
+    def get_agent_interactions(self, agent: Agent) -> Sequence[Interaction]:
         """
-        Retrieve all interactions involving a specific agent.
+        Retrieve the interactions involving a specific agent.
 
         This includes both interactions where the agent was the sender
-        and where they were the receiver.
+        and where they were the receiver. Only the most recent `history_limit`
+        interactions are kept, older ones are evicted as new ones are recorded
+        (they remain available through `get_all_interactions`).
+
+        Args:
+            agent (Agent): The agent whose interactions to retrieve.
+
+        Returns:
+            Sequence[Interaction]: A read-only view of the interactions involving the agent, oldest first.
+        """
+        handle = self._get_handle(agent)
+
+        if handle is None:
+            return []
+
+        return InteractionHistoryView(self._private_by_handle[handle])
+
+    def get_pairwise_interactions(self, agent: Agent, other_agent: Agent) -> Sequence[Interaction]:
+        """
+        Retrieve the interactions between two specific agents.
+
+        This includes the interactions sent by either agent to the other one,
+        as seen from the first agent's history.
 
         Args:
             agent (Agent): The agent whose interactions to retrieve.
+            other_agent (Agent): The other agent of the conversation.
+
+        Returns:
+            Sequence[Interaction]: A read-only view of the interactions between both agents, oldest first.
+        """
+        handle = self._get_handle(agent)
+        other_handle = self._get_handle(other_agent)
+
+        if handle is None or other_handle is None:
+            return []
+
+        conversation = self._pairwise_by_handle[handle].get(other_handle)
+
+        if conversation is None:
+            return []
+
+        return InteractionHistoryView(conversation)
+
+    def get_cached_context(self, agent: Agent, builder: Callable[[Sequence[Interaction]], str]) -> str:
+        """
+        Retrieve a context built from the interactions of a specific agent.
+
+        The context is only rebuilt when the agent's history changed since the last
+        call, or when a different builder is used, which avoids re-rendering every
+        interaction when building several prompts in a row. Only the last context
+        is kept for each agent, so the builder should be the same function across
+        calls (e.g. a module-level or static function rather than a new lambda).
+
+        Args:
+            agent (Agent): The agent whose interactions to build the context from.
+            builder (Callable[[Sequence[Interaction]], str]): The function building the
+                context from the agent's interactions.
 
         Returns:
-            List[Interaction]: A list of all interactions involving the agent.
+            str: The context built from the agent's interactions.
         """
-        return self._agent_private_interactions.get(agent.agent_id, [])
+        handle = self._get_handle(agent)
+
+        if handle is None:
+            return builder(self.get_agent_interactions(agent))
+
+        version = self._versions_by_handle[handle]
+        cached = self._context_cache.get(handle)
+
+        if cached is not None and cached[0] == version and cached[1] is builder:
+            return cached[2]
+
+        context = builder(InteractionHistoryView(self._private_by_handle[handle]))
+        self._context_cache[handle] = (version, builder, context)
+
+        return context
+
+
+def get_instance() -> AgentInteractionManager:
+    """
+    Retrieve the AgentInteractionManager singleton.
+
+    Equivalent to `AgentInteractionManager()`, but once the instance exists this
+    is a single attribute lookup instead of going through `__new__` and `__init__`.
+
+    Returns:
+        AgentInteractionManager: The single instance of the manager.
+    """
+    return AgentInteractionManager._instance or AgentInteractionManager()
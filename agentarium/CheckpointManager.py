@@ -2,7 +2,7 @@ import os
 import dill
 
 from collections import OrderedDict
-from .AgentInteractionManager import AgentInteractionManager
+from .AgentInteractionManager import get_instance
 
 # NOTE: if someone knows how to fix this, please do it :D
 import warnings
@@ -50,7 +50,7 @@ class CheckpointManager:
         self.name = name
         self.path = f"{self.name}.dill"
 
-        self._interaction_manager = AgentInteractionManager()
+        self._interaction_manager = get_instance()
 
         self._action_idx = 0
         self.recorded_actions = []
@@ -67,6 +67,12 @@ class CheckpointManager:
 
         dill.dump({"actions": self.recorded_actions}, open(self.path, "wb"), byref=True)
 
+        # Make sure the interactions recorded so far are on disk along with the checkpoint
+        interaction_log = self._interaction_manager.get_interaction_log()
+
+        if interaction_log is not None:
+            interaction_log.flush()
+
     def load(self) -> None:
         """
         Load a simulation from a checkpoint.
@@ -14,15 +14,20 @@ class Config:
 
     The configuration currently supports:
     - LLM provider and model settings
+    - The number of interactions kept in each agent's history (the global
+      interaction history is not bounded)
 
     Environment variables:
     - AGENTARIUM_LLM_PROVIDER: The LLM provider to use
     - AGENTARIUM_LLM_MODEL: The specific model to use
+    - AGENTARIUM_HISTORY_LIMIT: The number of interactions kept per agent (empty for no limit)
 
     Example config.yaml:
         llm:
           provider: "openai"
           model: "gpt-4o-mini"
+        history:
+          limit: 10000  # or null for no limit
     """
 
     _instance = None
@@ -66,6 +71,9 @@ class Config:
             "llm": {
                 "provider": "openai",
                 "model": "gpt-4o-mini"
+            },
+            "history": {
+                "limit": 10_000
             }
         }
 
@@ -82,6 +90,14 @@ class Config:
         self._config["llm"]["provider"] = os.getenv("AGENTARIUM_LLM_PROVIDER", self._config["llm"]["provider"])
         self._config["llm"]["model"] = os.getenv("AGENTARIUM_LLM_MODEL", self._config["llm"]["model"])
 
+        history_limit = os.getenv("AGENTARIUM_HISTORY_LIMIT", self._config["history"]["limit"])
+        history_limit = None if history_limit in (None, "") else int(history_limit)
+
+        if history_limit is not None and history_limit < 1:
+            raise ValueError(f"The history limit must be a positive integer or null, got: {history_limit}")
+
+        self._config["history"]["limit"] = history_limit
+
 
     def _deep_update(self, d: Dict, u: Dict) -> Dict:
         """
@@ -121,6 +137,20 @@ class Config:
         """
         return self._config["llm"]["model"]
 
+    @property
+    def history_limit(self) -> int | None:
+        """
+        Get the maximum number of interactions kept in each agent's history.
+
+        Returns:
+            int | None: The number of most recent interactions kept per agent, None for no limit
+
+        Note:
+            This only bounds the agents' histories, the global interaction history
+            of the AgentInteractionManager keeps every interaction.
+        """
+        return self._config["history"]["limit"]
+
     @property
     def aisuite(self) -> dict:
         """
@@ -1,11 +1,32 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .Agent import Agent
+    from .AgentInteractionManager import AgentInteractionManager
 
-@dataclass
+# Bound on first use, as the AgentInteractionManager module imports this one
+_get_instance = None
+
+
+def _get_interaction_manager() -> AgentInteractionManager:
+    """
+    Retrieve the AgentInteractionManager singleton, used to resolve agents from their IDs.
+
+    Returns:
+        AgentInteractionManager: The single instance of the manager.
+    """
+    global _get_instance
+
+    if _get_instance is None:
+        from .AgentInteractionManager import get_instance
+        _get_instance = get_instance
+
+    return _get_instance()
+
+
+@dataclass(slots=True, frozen=True, init=False)
 class Interaction:
     """
     Represents a single interaction between two agents in the environment.
@@ -14,28 +35,110 @@ class Interaction:
     including who initiated the interaction (sender), who received it (receiver),
     and the content of the interaction (message).
 
+    Interactions are immutable and can be hashed. They only store the IDs of the
+    agents involved, the agents themselves are resolved through the
+    AgentInteractionManager when accessed.
+
     Attributes:
-        sender (Agent): The agent who initiated the interaction.
-        receiver (Agent): The agent who received the interaction.
+        sender_id (str): The ID of the agent who initiated the interaction.
+        receiver_ids (tuple[str, ...]): The ID(s) of the agent(s) who received the interaction.
         message (str): The content of the interaction between the agents.
     """
 
-    sender: Agent
-    """The agent who initiated the interaction."""
+    sender_id: str
+    """The ID of the agent who initiated the interaction."""
 
-    receiver: list[Agent]
-    """The agent(s) who received the interaction."""
+    receiver_ids: tuple[str, ...]
+    """The ID(s) of the agent(s) who received the interaction."""
 
     message: str
     """The content of the interaction between the agents."""
 
+    _str: str | None = field(default=None, repr=False, compare=False)
+    """The cached human-readable representation of the interaction, built on first use."""
+
+    _str_version: int = field(default=0, repr=False, compare=False)
+    """The registry version of the interaction manager when the cached representation was built."""
+
+    def __init__(self, sender: Agent, receiver: list[Agent], message: str):
+        """
+        Creates an interaction between agents.
+
+        Args:
+            sender (Agent): The agent who initiated the interaction.
+            receiver (list[Agent]): The agent(s) who received the interaction.
+            message (str): The content of the interaction between the agents.
+        """
+        self._set_fields(sender.agent_id, tuple(_receiver.agent_id for _receiver in receiver), message)
+
+    @classmethod
+    def from_ids(cls, sender_id: str, receiver_ids: tuple[str, ...], message: str) -> Interaction:
+        """
+        Creates an interaction directly from the IDs of the agents involved.
+
+        Args:
+            sender_id (str): The ID of the agent who initiated the interaction.
+            receiver_ids (tuple[str, ...]): The ID(s) of the agent(s) who received the interaction.
+            message (str): The content of the interaction between the agents.
+
+        Returns:
+            Interaction: The created interaction.
+        """
+        interaction = cls.__new__(cls)
+        interaction._set_fields(sender_id, receiver_ids, message)
+        return interaction
+
+    def _set_fields(self, sender_id: str, receiver_ids: tuple[str, ...], message: str) -> None:
+        """
+        Sets the fields of the (frozen) interaction.
+        """
+        object.__setattr__(self, "sender_id", sender_id)
+        object.__setattr__(self, "receiver_ids", receiver_ids)
+        object.__setattr__(self, "message", message)
+        object.__setattr__(self, "_str", None)
+        object.__setattr__(self, "_str_version", 0)
+
+    def __getstate__(self) -> tuple:
+        """
+        Returns the state to pickle, leaving out the cached string representation.
+        """
+        return (self.sender_id, self.receiver_ids, self.message)
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Restores the interaction from its pickled state.
+        """
+        self._set_fields(*state)
+
+    @property
+    def sender(self) -> Agent | None:
+        """
+        The agent who initiated the interaction.
+
+        Returns:
+            Agent | None: The sender if registered in the interaction manager, None otherwise.
+        """
+        return _get_interaction_manager().get_agent(self.sender_id)
+
+    @property
+    def receiver(self) -> tuple[Agent | None, ...]:
+        """
+        The agent(s) who received the interaction.
+
+        Returns:
+            tuple[Agent | None, ...]: The receivers, None for those not registered in the interaction manager.
+        """
+        interaction_manager = _get_interaction_manager()
+
+        return tuple(interaction_manager.get_agent(_receiver_id) for _receiver_id in self.receiver_ids)
+
     def dump(self) -> dict:
         """
         Returns a dictionary representation of the interaction.
         """
         return {
-            "sender": self.sender.agent_id,
-            "receiver": [receiver.agent_id for receiver in self.receiver],
+            "sender": self.sender_id,
+            "receiver": list(self.receiver_ids),
             "message": self.message,
         }
 
@@ -43,14 +146,34 @@ class Interaction:
         """
         Returns a human-readable string representation of the interaction.
 
+        As interactions are immutable, the string is only built once and then cached,
+        until an agent ID is registered again (possibly under a different name).
+        Agents not registered in the interaction manager are shown as "?" with their ID.
+
         Returns:
             str: A formatted string showing sender, receiver, and the interaction message.
         """
 
-        if len(self.receiver) == 1:
-            return f"{self.sender.name} ({self.sender.agent_id}) said to {self.receiver[0].name} ({self.receiver[0].agent_id}): {self.message}"
+        registry_version = _get_interaction_manager()._registry_version
+
+        if self._str is not None and self._str_version == registry_version:
+            return self._str
+
+        # Agents that can't be resolved (not registered) are shown as "?" along with their ID
+        agents = (self.sender, *self.receiver)
+        sender_name, *receiver_names = (agent.name if agent is not None else "?" for agent in agents)
+
+        if len(receiver_names) == 1:
+            _str = f"{sender_name} ({self.sender_id}) said to {receiver_names[0]} ({self.receiver_ids[0]}): {self.message}"
         else:
-            return f"{self.sender.name} ({self.sender.agent_id}) said to {', '.join([_receiver.name + f'({_receiver.agent_id})' for _receiver in self.receiver])}: {self.message}"
+            _str = f"{sender_name} ({self.sender_id}) said to {', '.join(f'{name}({_receiver_id})' for name, _receiver_id in zip(receiver_names, self.receiver_ids))}: {self.message}"
+
+        # Only cache the string once every agent could be resolved
+        if None not in agents:
+            object.__setattr__(self, "_str", _str)
+            object.__setattr__(self, "_str_version", registry_version)
+
+        return _str
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import os
+import mmap
+import struct
+
+from typing import List, Sequence, Tuple
+
+
+class _MappedFile:
+    """
+    A file mapped in memory that can only be appended to.
+
+    The file is grown by doubling its size whenever an append doesn't fit,
+    so that the mapping only has to be recreated a logarithmic number of times.
+    """
+
+    def __init__(self, path: str, used: int = 0):
+        """
+        Open (or create) the file and map it in memory.
+
+        Args:
+            path (str): Path of the file to map.
+            used (int): Number of bytes of the file already holding data.
+        """
+        self.path = path
+        self.used = used
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT)
+        self._capacity = max(os.fstat(self._fd).st_size, mmap.PAGESIZE)
+
+        os.ftruncate(self._fd, self._capacity)
+        self.mm = mmap.mmap(self._fd, self._capacity)
+
+    def reserve(self, size: int) -> int:
+        """
+        Reserve space at the end of the file, growing it if needed.
+
+        Args:
+            size (int): Number of bytes to reserve.
+
+        Returns:
+            int: The offset of the reserved space.
+        """
+        offset = self.used
+
+        if offset + size > self._capacity:
+            self._capacity = max(2 * self._capacity, offset + size)
+            self.mm.close()
+            os.ftruncate(self._fd, self._capacity)
+            self.mm = mmap.mmap(self._fd, self._capacity)
+
+        self.used += size
+        return offset
+
+    def flush(self) -> None:
+        """
+        Write the mapped content to disk.
+        """
+        self.mm.flush()
+        os.fsync(self._fd)
+
+    def close(self) -> None:
+        """
+        Unmap the file and truncate it to the bytes actually used.
+        """
+        self.mm.close()
+        os.ftruncate(self._fd, self.used)
+        os.close(self._fd)
+
+
+class InteractionLog:
+    """
+    An append-only, memory-mapped log of interactions.
+
+    Instead of keeping every interaction as a Python object, the log stores them
+    in three files, so very long simulations don't have to keep their whole history
+    in memory and the history can be made durable with a simple flush:
+    - `<path>.idx`: a header holding the number of interactions, followed by one
+      fixed-size record per interaction (sender handle, offset and count of its
+      receivers, offset and length of its message)
+    - `<path>.rcv`: the receiver handles of every interaction, as uint32
+    - `<path>.msg`: the messages of every interaction, encoded in UTF-8
+
+    Agents are referenced by the handle assigned to them by the AgentInteractionManager.
+    Handles follow the agents' registration order, so a log only maps back to the same
+    agents when they are registered in the same order (e.g. when replaying a checkpoint).
+    """
+
+    _header = struct.Struct("<Q")
+    _record = struct.Struct("<IQIQI")
+    _receiver = struct.Struct("<I")
+
+    def __init__(self, path: str):
+        """
+        Open the log at the given path, creating it if it doesn't exist.
+
+        Args:
+            path (str): Path prefix of the log files.
+        """
+        self.path = path
+
+        self._index = _MappedFile(f"{path}.idx")
+        self._count = self._header.unpack_from(self._index.mm, 0)[0]
+        self._index.used = self._header.size + self._count * self._record.size
+
+        receivers_used = messages_used = 0
+
+        if self._count > 0:
+            _, receivers_offset, receivers_count, message_offset, message_length = self._read_record(self._count - 1)
+            receivers_used = (receivers_offset + receivers_count) * self._receiver.size
+            messages_used = message_offset + message_length
+
+        self._receivers = _MappedFile(f"{path}.rcv", used=receivers_used)
+        self._messages = _MappedFile(f"{path}.msg", used=messages_used)
+
+    def _read_record(self, index: int) -> Tuple[int, int, int, int, int]:
+        """
+        Read the index record of an interaction.
+
+        Args:
+            index (int): The position of the interaction in the log.
+
+        Returns:
+            Tuple[int, int, int, int, int]: The sender handle, the offset and count of
+                the receivers, and the offset and length of the message.
+        """
+        return self._record.unpack_from(self._index.mm, self._header.size + index * self._record.size)
+
+    def append(self, sender_handle: int, receiver_handles: Sequence[int], message: str) -> None:
+        """
+        Append an interaction to the log.
+
+        Args:
+            sender_handle (int): The handle of the agent initiating the interaction.
+            receiver_handles (Sequence[int]): The handles of the agent(s) receiving the interaction.
+            message (str): The content of the interaction.
+        """
+        encoded_message = message.encode("utf-8")
+
+        receivers_offset = self._receivers.reserve(len(receiver_handles) * self._receiver.size)
+        struct.pack_into(f"<{len(receiver_handles)}I", self._receivers.mm, receivers_offset, *receiver_handles)
+
+        message_offset = self._messages.reserve(len(encoded_message))
+        self._messages.mm[message_offset:message_offset + len(encoded_message)] = encoded_message
+
+        record_offset = self._index.reserve(self._record.size)
+        self._record.pack_into(
+            self._index.mm,
+            record_offset,
+            sender_handle,
+            receivers_offset // self._receiver.size,
+            len(receiver_handles),
+            message_offset,
+            len(encoded_message),
+        )
+
+        # The count is written last so that a partially written interaction is never visible
+        self._count += 1
+        self._header.pack_into(self._index.mm, 0, self._count)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of interactions in the log.
+        """
+        return self._count
+
+    def __getitem__(self, index: int) -> Tuple[int, Tuple[int, ...], str]:
+        """
+        Read an interaction from the log.
+
+        Args:
+            index (int): The position of the interaction in the log.
+
+        Returns:
+            Tuple[int, Tuple[int, ...], str]: The sender handle, the receiver handles
+                and the message of the interaction.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError(f"Interaction index out of range: {index}")
+
+        sender_handle, receivers_offset, receivers_count, message_offset, message_length = self._read_record(index)
+
+        receiver_handles = struct.unpack_from(f"<{receivers_count}I", self._receivers.mm, receivers_offset * self._receiver.size)
+        message = self._messages.mm[message_offset:message_offset + message_length].decode("utf-8")
+
+        return sender_handle, receiver_handles, message
+
+    def get_agent_indices(self, handle: int) -> List[int]:
+        """
+        Retrieve the positions of all interactions involving a specific agent.
+
+        Args:
+            handle (int): The handle of the agent.
+
+        Returns:
+            List[int]: The positions, in the log, of the interactions where the agent
+                was either the sender or a receiver.
+        """
+        indices = []
+        records = self._index.mm[self._header.size:self._index.used]
+
+        for index, (sender_handle, receivers_offset, receivers_count, _, _) in enumerate(self._record.iter_unpack(records)):
+            if sender_handle == handle or handle in struct.unpack_from(f"<{receivers_count}I", self._receivers.mm, receivers_offset * self._receiver.size):
+                indices.append(index)
+
+        return indices
+
+    def flush(self) -> None:
+        """
+        Write the log to disk.
+        """
+        self._receivers.flush()
+        self._messages.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        """
+        Write the log to disk and close its files.
+        """
+        self.flush()
+        self._receivers.close()
+        self._messages.close()
+        self._index.close()
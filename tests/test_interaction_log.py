@@ -0,0 +1,67 @@
+import pytest
+
+from agentarium.InteractionLog import InteractionLog
+
+
+@pytest.fixture
+def interaction_log(tmp_path):
+    """Create a test interaction log."""
+    log = InteractionLog(str(tmp_path / "interactions"))
+    yield log
+    log.close()
+
+
+def test_append_and_read(interaction_log):
+    """Test appending interactions to the log and reading them back."""
+    interaction_log.append(0, [1], "Hello Bob!")
+    interaction_log.append(1, [0, 2], "Hi everyone! 👋")
+    interaction_log.append(2, [2], "")
+
+    assert len(interaction_log) == 3
+    assert interaction_log[0] == (0, (1,), "Hello Bob!")
+    assert interaction_log[1] == (1, (0, 2), "Hi everyone! 👋")
+    assert interaction_log[-1] == (2, (2,), "")
+
+    with pytest.raises(IndexError):
+        interaction_log[3]
+
+
+def test_growth(interaction_log):
+    """Test that the log grows past its initial size."""
+    message = "x" * 1000
+
+    for i in range(100):
+        interaction_log.append(i, list(range(i)), message)
+
+    assert len(interaction_log) == 100
+    assert interaction_log[99] == (99, tuple(range(99)), message)
+
+
+def test_get_agent_indices(interaction_log):
+    """Test retrieving the interactions involving an agent."""
+    interaction_log.append(0, [1], "Hello Bob!")
+    interaction_log.append(1, [0], "Hi Alice!")
+    interaction_log.append(2, [2], "I'm alone")
+    interaction_log.append(2, [0, 1], "Hello both of you!")
+
+    assert interaction_log.get_agent_indices(0) == [0, 1, 3]
+    assert interaction_log.get_agent_indices(2) == [2, 3]
+    assert interaction_log.get_agent_indices(3) == []
+
+
+def test_reopen(tmp_path):
+    """Test that a closed log can be reopened and appended to."""
+    path = str(tmp_path / "interactions")
+
+    log = InteractionLog(path)
+    log.append(0, [1], "Hello Bob!")
+    log.close()
+
+    log = InteractionLog(path)
+    log.append(1, [0], "Hi Alice!")
+
+    assert len(log) == 2
+    assert log[0] == (0, (1,), "Hello Bob!")
+    assert log[1] == (1, (0,), "Hi Alice!")
+
+    log.close()
@@ -1,7 +1,12 @@
+import dill
+import pickle
 import pytest
+import threading
 
 from agentarium.Agent import Agent
-from agentarium.AgentInteractionManager import AgentInteractionManager
+from agentarium.Config import Config
+from agentarium.Interaction import Interaction
+from agentarium.AgentInteractionManager import AgentInteractionManager, get_instance
 
 @pytest.fixture
 def interaction_manager():
@@ -109,3 +114,343 @@ def test_interaction_validation(interaction_manager, agent_pair):
 
     with pytest.raises(ValueError):
         interaction_manager.record_interaction(alice, unregistered_agent, "Hello")
+
+def test_get_all_interactions(interaction_manager, agent_pair):
+    """Test retrieving the global interaction history."""
+    alice, bob = agent_pair
+
+    interaction_manager.record_interaction(alice, [alice, bob], "Hello everyone!")
+
+    interaction = interaction_manager.get_all_interactions()[-1]
+    assert interaction is alice.get_interactions()[-1]
+    assert interaction.sender is alice
+    assert [receiver.agent_id for receiver in interaction.receiver] == [alice.agent_id, bob.agent_id]
+    assert interaction.message == "Hello everyone!"
+
+def test_agent_handles_resolved_by_id(interaction_manager, agent_pair):
+    """Test that objects sharing a registered agent's ID see that agent's history."""
+    alice, bob = agent_pair
+
+    # Same ID as Bob, but never registered itself (so it has no handle)
+    bob_copy = type("BobCopy", (Agent,), {
+        "agent_id": bob.agent_id,
+        "__init__": lambda self, *args, **kwargs: None,
+        "agent_informations": {},
+    })()
+
+    interaction_manager.record_interaction(alice, bob, "Hello Bob!")
+
+    assert [interaction.message for interaction in interaction_manager.get_agent_interactions(bob_copy)] == ["Hello Bob!"]
+    assert [interaction.message for interaction in interaction_manager.get_pairwise_interactions(bob_copy, alice)] == ["Hello Bob!"]
+    assert "Hello Bob!" in interaction_manager.get_cached_context(bob_copy, Agent._format_interactions)
+
+def test_non_string_agent_id(interaction_manager):
+    """Test registering an agent whose ID is not a string."""
+    agent = Agent.create_agent(agent_id=42, name="Charlie", bio="Charlie is a test agent")
+
+    assert agent.agent_id == 42
+    assert interaction_manager.get_agent(42) is agent
+
+    agent.reset()
+
+def test_agent_handles(interaction_manager, agent_pair):
+    """Test that each registered agent gets a stable handle."""
+    alice, bob = agent_pair
+
+    assert alice._handle != bob._handle
+    assert interaction_manager._agents_by_handle[alice._handle] is alice
+
+    # Re-registering an agent keeps its handle
+    handle = alice._handle
+    interaction_manager.register_agent(alice)
+    assert alice._handle == handle
+
+def test_history_limit(interaction_manager, agent_pair):
+    """Test that agent histories only keep the most recent interactions."""
+    alice, bob = agent_pair
+
+    history_limit = interaction_manager._history_limit
+    interaction_manager._history_limit = 2
+
+    try:
+        alice.reset()
+
+        for msg in ["First", "Second", "Third"]:
+            interaction_manager.record_interaction(alice, bob, msg)
+
+        assert [interaction.message for interaction in alice.get_interactions()] == ["Second", "Third"]
+    finally:
+        interaction_manager._history_limit = history_limit
+
+
+def test_history_limit_from_config(monkeypatch, tmp_path):
+    """Test that a null history limit in config.yaml means no limit."""
+    config = Config()
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.yaml").write_text("history:\n  limit: null\n")
+
+    try:
+        config._load_config()
+        assert config.history_limit is None
+
+        monkeypatch.setenv("AGENTARIUM_HISTORY_LIMIT", "5")
+        config._load_config()
+        assert config.history_limit == 5
+
+        monkeypatch.setenv("AGENTARIUM_HISTORY_LIMIT", "0")
+        with pytest.raises(ValueError):
+            config._load_config()
+    finally:
+        monkeypatch.undo()
+        config._load_config()
+
+def test_agent_interactions_are_read_only(interaction_manager, agent_pair):
+    """Test that the returned interactions can be sliced but not modified."""
+    alice, bob = agent_pair
+
+    for msg in ["First", "Second", "Third"]:
+        interaction_manager.record_interaction(alice, bob, msg)
+
+    interactions = alice.get_interactions()
+    assert [interaction.message for interaction in interactions[-2:]] == ["Second", "Third"]
+    assert repr(interactions) == repr(list(interactions))
+
+    assert not hasattr(interactions, "append")
+    assert not hasattr(interactions, "clear")
+
+    # The view reflects interactions recorded after it was retrieved
+    interaction_manager.record_interaction(bob, alice, "Fourth")
+    assert interactions[-1].message == "Fourth"
+
+def test_get_pairwise_interactions(interaction_manager, agent_pair):
+    """Test retrieving the interactions between two agents."""
+    alice, bob = agent_pair
+
+    interaction_manager.record_interaction(alice, bob, "Hello Bob!")
+    interaction_manager.record_interaction(bob, alice, "Hi Alice!")
+    interaction_manager.record_interaction(alice, alice, "Bob seems nice")
+
+    alice_with_bob = interaction_manager.get_pairwise_interactions(alice, bob)
+    assert [interaction.message for interaction in alice_with_bob] == ["Hello Bob!", "Hi Alice!"]
+
+    bob_with_alice = interaction_manager.get_pairwise_interactions(bob, alice)
+    assert [interaction.message for interaction in bob_with_alice] == ["Hello Bob!", "Hi Alice!"]
+
+    alice_with_herself = interaction_manager.get_pairwise_interactions(alice, alice)
+    assert [interaction.message for interaction in alice_with_herself] == ["Bob seems nice"]
+
+def test_get_cached_context(interaction_manager, agent_pair):
+    """Test that interaction contexts are only rebuilt when the history changes."""
+    alice, bob = agent_pair
+    calls = []
+
+    def builder(interactions):
+        calls.append(len(interactions))
+        return "\n".join(str(interaction) for interaction in interactions)
+
+    interaction_manager.record_interaction(alice, bob, "Hello Bob!")
+
+    context = interaction_manager.get_cached_context(alice, builder)
+    assert interaction_manager.get_cached_context(alice, builder) == context
+    assert calls == [1]
+
+    interaction_manager.record_interaction(bob, alice, "Hi Alice!")
+
+    assert "Hi Alice!" in interaction_manager.get_cached_context(alice, builder)
+    assert calls == [1, 2]
+
+    # Only the last context is kept for each agent
+    for _ in range(3):
+        interaction_manager.get_cached_context(alice, lambda interactions: "x")
+
+    assert len(interaction_manager._context_cache) <= len(interaction_manager._agents_by_handle)
+    assert interaction_manager._context_cache[alice._handle][2] == "x"
+
+def test_interaction_log(interaction_manager, agent_pair, tmp_path):
+    """Test recording interactions in an on-disk log."""
+    alice, bob = agent_pair
+
+    interaction_log = interaction_manager.enable_interaction_log(str(tmp_path / "interactions"))
+
+    try:
+        interaction_manager.record_interaction(alice, bob, "Hello Bob!")
+
+        assert interaction_manager.get_interaction_log() is interaction_log
+        assert interaction_log[-1] == (alice._handle, (bob._handle,), "Hello Bob!")
+    finally:
+        interaction_log.close()
+        interaction_manager._interaction_log = None
+
+def test_record_interactions_batch(interaction_manager, agent_pair):
+    """Test recording several interactions at once."""
+    alice, bob = agent_pair
+
+    interaction_manager.record_interactions_batch([
+        (alice, bob, "Hello Bob!"),
+        (bob, [alice, bob], "Hi Alice!"),
+        (alice, alice, "Bob seems nice"),
+    ])
+
+    assert [interaction.message for interaction in alice.get_interactions()] == ["Hello Bob!", "Hi Alice!", "Bob seems nice"]
+    assert [interaction.message for interaction in bob.get_interactions()] == ["Hello Bob!", "Hi Alice!"]
+
+def test_record_interactions_batch_validation(interaction_manager, agent_pair):
+    """Test that a batch with an unregistered agent records nothing."""
+    alice, bob = agent_pair
+
+    unregistered_agent = type("UnregisteredAgent", (Agent,), {
+        "agent_id": "some_unregistered_id",
+        "__init__": lambda self, *args, **kwargs: None,
+        "agent_informations": {},
+    })()
+
+    with pytest.raises(ValueError):
+        interaction_manager.record_interactions_batch([
+            (alice, bob, "Hello Bob!"),
+            (alice, unregistered_agent, "Hello"),
+        ])
+
+    assert len(alice.get_interactions()) == 0
+
+def test_record_interactions_batch_resolves_agents(interaction_manager, agent_pair):
+    """Test that a batch records objects sharing a registered agent's ID."""
+    alice, bob = agent_pair
+
+    # Same ID as Bob, but never registered itself (so it has no handle)
+    bob_copy = type("BobCopy", (Agent,), {
+        "agent_id": bob.agent_id,
+        "__init__": lambda self, *args, **kwargs: None,
+        "agent_informations": {},
+    })()
+
+    interaction_manager.record_interactions_batch([
+        (alice, bob, "Hello Bob!"),
+        (alice, bob_copy, "Hello again Bob!"),
+    ])
+
+    assert [interaction.message for interaction in bob.get_interactions()] == ["Hello Bob!", "Hello again Bob!"]
+
+def test_record_interaction_resolves_agents(interaction_manager, agent_pair):
+    """Test that a single interaction records objects sharing a registered agent's ID."""
+    alice, bob = agent_pair
+
+    # Same ID as Bob, but never registered itself (so it has no handle)
+    bob_copy = type("BobCopy", (Agent,), {
+        "agent_id": bob.agent_id,
+        "__init__": lambda self, *args, **kwargs: None,
+        "agent_informations": {},
+    })()
+
+    n_interactions = len(interaction_manager.get_all_interactions())
+
+    interaction_manager.record_interaction(alice, bob_copy, "Hello Bob!")
+    interaction_manager.record_interaction(bob_copy, alice, "Hi Alice!")
+
+    assert len(interaction_manager.get_all_interactions()) == n_interactions + 2
+    assert [interaction.message for interaction in alice.get_interactions()] == ["Hello Bob!", "Hi Alice!"]
+    assert [interaction.message for interaction in bob.get_interactions()] == ["Hello Bob!", "Hi Alice!"]
+
+def test_interaction_stores_agent_ids(interaction_manager, agent_pair):
+    """Test that interactions reference agents by ID."""
+    alice, bob = agent_pair
+
+    interaction_manager.record_interaction(alice, [alice, bob], "Hello everyone!")
+
+    interaction = alice.get_interactions()[-1]
+    assert interaction.sender_id == alice.agent_id
+    assert interaction.receiver_ids == (alice.agent_id, bob.agent_id)
+    assert interaction.receiver == (alice, bob)
+    assert interaction.dump() == {
+        "sender": alice.agent_id,
+        "receiver": [alice.agent_id, bob.agent_id],
+        "message": "Hello everyone!",
+    }
+
+def test_get_instance(interaction_manager):
+    """Test that get_instance returns the singleton."""
+    assert get_instance() is interaction_manager
+    assert get_instance() is AgentInteractionManager()
+
+def test_singleton_thread_safety():
+    """Test that concurrent instantiations all get the same manager."""
+    instance = AgentInteractionManager._instance
+    AgentInteractionManager._instance = None
+
+    n_threads = 16
+    barrier = threading.Barrier(n_threads)
+    managers = []
+
+    def create_manager():
+        barrier.wait()
+        managers.append(AgentInteractionManager())
+
+    try:
+        threads = [threading.Thread(target=create_manager) for _ in range(n_threads)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert len(managers) == n_threads
+        assert all(manager is managers[0] for manager in managers)
+        assert get_instance() is managers[0]
+    finally:
+        AgentInteractionManager._instance = instance
+
+def test_interaction_str_cache(agent_pair):
+    """Test that the string representation of an interaction is cached."""
+    alice, bob = agent_pair
+
+    interaction = Interaction(sender=alice, receiver=[bob], message="Hello Bob!")
+    other_interaction = Interaction(sender=alice, receiver=[bob], message="Hello Bob!")
+
+    # The string is only computed once
+    assert str(interaction) is str(interaction)
+    assert interaction._str is not None
+    assert other_interaction._str is None
+
+    # The cached string doesn't affect equality nor hashing
+    assert interaction == other_interaction
+    assert hash(interaction) == hash(other_interaction)
+
+    # The cached string isn't pickled (dill is used by reference, like the CheckpointManager does)
+    for unpickled_interaction in (
+        pickle.loads(pickle.dumps(interaction)),
+        dill.loads(dill.dumps(interaction, byref=True)),
+    ):
+        assert unpickled_interaction == interaction
+        assert unpickled_interaction._str is None
+        assert str(unpickled_interaction) == str(interaction)
+
+def test_interaction_str_cache_invalidated_on_registration(interaction_manager, agent_pair):
+    """Test that cached strings are rebuilt when an agent ID is registered again."""
+    alice, bob = agent_pair
+
+    interaction = Interaction(sender=alice, receiver=[bob], message="Hello Bob!")
+    assert str(interaction).startswith("Alice")
+
+    Agent.create_agent(agent_id=alice.agent_id, name="Alicia", bio="Alicia is a test agent")
+
+    try:
+        assert str(interaction).startswith("Alicia")
+    finally:
+        interaction_manager.register_agent(alice)
+
+def test_interaction_str_with_unregistered_agent(agent_pair):
+    """Test the string representation of an interaction with an unregistered agent."""
+    _, bob = agent_pair
+
+    unregistered_agent = type("UnregisteredAgent", (Agent,), {
+        "agent_id": "some_unregistered_id",
+        "__init__": lambda self, *args, **kwargs: None,
+        "agent_informations": {},
+    })()
+
+    interaction = Interaction(sender=unregistered_agent, receiver=[bob], message="yo")
+    assert str(interaction) == f"? (some_unregistered_id) said to Bob ({bob.agent_id}): yo"
+    assert repr(interaction) == str(interaction)
+
+    interaction = Interaction(sender=bob, receiver=[bob, unregistered_agent], message="yo")
+    assert str(interaction) == f"Bob ({bob.agent_id}) said to Bob({bob.agent_id}), ?(some_unregistered_id): yo"